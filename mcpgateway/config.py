@@ -832,6 +832,9 @@ class Settings(BaseSettings):
     tool_rate_limit: int = 100  # requests per minute
     tool_concurrent_limit: int = 10
 
+    # OpenAPI import
+    use_aiohttp_for_spec_fetch: bool = Field(default=False, description="Fetch OpenAPI specs with a pooled aiohttp session instead of the default httpx client")
+
     # Prompts
     prompt_cache_size: int = 100
     max_prompt_size: int = 100 * 1024  # 100KB
@@ -23,12 +23,14 @@ Examples:
 
 # Standard
 from datetime import datetime, timedelta, timezone
+import json
 import logging
 from typing import Any, cast, Dict, Generator, List, Optional, TYPE_CHECKING
 import uuid
 
 # Third-Party
 import jsonschema
+import orjson
 from sqlalchemy import Boolean, Column, create_engine, DateTime, event, Float, ForeignKey, func, Index, Integer, JSON, make_url, select, String, Table, Text, UniqueConstraint
 from sqlalchemy.event import listen
 from sqlalchemy.exc import SQLAlchemyError
@@ -86,6 +88,33 @@ elif backend == "sqlite":
 
 # 4. Other backends (MySQL, MSSQL, etc.) leave `connect_args` empty.
 
+
+def _json_serializer(value: Any) -> str:
+    """Serialize a JSON column value with orjson, falling back to the stdlib for values it rejects.
+
+    JSON columns (tool input schemas, annotations, headers, ...) are encoded on
+    every insert/update, which dominates bulk imports such as OpenAPI tool
+    generation. orjson only refuses values stdlib json accepts in rare cases
+    (integers beyond 64 bits), so those keep the previous encoding.
+
+    Args:
+        value: JSON-compatible value to store
+
+    Returns:
+        str: JSON text
+
+    Examples:
+        >>> _json_serializer({"type": "object", "required": ["id"]})
+        '{"type":"object","required":["id"]}'
+        >>> _json_serializer({"big": 2**70})
+        '{"big": 1180591620717411303424}'
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(value)
+
+
 # ---------------------------------------------------------------------------
 # 5. Build the Engine with a single, clean connect_args mapping.
 # ---------------------------------------------------------------------------
@@ -107,6 +136,7 @@ if backend == "sqlite":
         # SQLite specific optimizations
         poolclass=QueuePool,  # Explicit pool class
         connect_args=connect_args,
+        json_serializer=_json_serializer,
         # Log pool events in debug mode
         echo_pool=settings.log_level == "DEBUG",
     )
@@ -120,6 +150,7 @@ else:
         pool_timeout=settings.db_pool_timeout,
         pool_recycle=settings.db_pool_recycle,
         connect_args=connect_args,
+        json_serializer=_json_serializer,
     )
 
 
@@ -119,7 +119,7 @@ from mcpgateway.transports.streamablehttp_transport import SessionManagerWrapper
 from mcpgateway.utils.db_isready import wait_for_db_ready
 from mcpgateway.utils.error_formatter import ErrorFormatter
 from mcpgateway.utils.metadata_capture import MetadataCapture
-from mcpgateway.utils.openapi_parser import convert_openapi_to_tools, extract_base_url, extract_security_config, parse_openapi_spec
+from mcpgateway.utils.openapi_parser import close_openapi_client, convert_openapi_to_tools, extract_base_url, extract_security_config, parse_openapi_spec
 from mcpgateway.utils.orjson_response import ORJSONResponse
 from mcpgateway.utils.passthrough_headers import set_global_passthrough_headers
 from mcpgateway.utils.redis_isready import wait_for_redis_ready
@@ -398,6 +398,10 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
                 await service.shutdown()
             except Exception as e:
                 logger.error(f"Error shutting down {service.__class__.__name__}: {str(e)}")
+        try:
+            await close_openapi_client()
+        except Exception as e:
+            logger.error(f"Error closing OpenAPI spec HTTP client: {str(e)}")
         logger.info("Shutdown complete")
 
 
@@ -2311,9 +2315,9 @@ async def import_tools_from_openapi(
             logger.warning(f"Failed to extract security config (continuing without auth): {e}")
             auth_config = {"auth_type": None}
 
-        # Convert OpenAPI operations to ToolCreate objects
+        # Convert OpenAPI operations to ToolCreate objects (CPU-bound for large specs, so keep it off the event loop)
         try:
-            tools_to_create = convert_openapi_to_tools(spec, base_url, auth_config, namespace=import_request.namespace)
+            tools_to_create = await asyncio.to_thread(convert_openapi_to_tools, spec, base_url, auth_config, namespace=import_request.namespace)
             logger.info(f"Parsed {len(tools_to_create)} tools from OpenAPI spec")
         except ValueError as e:
             logger.error(f"Failed to convert OpenAPI to tools: {e}")
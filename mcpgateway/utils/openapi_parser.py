@@ -11,27 +11,310 @@ them into MCP Gateway tool definitions.
 """
 
 # Standard
+import asyncio
+from collections import OrderedDict
+import copy
+import functools
+import hashlib
 import logging
 import re
-from typing import Any, Dict, List, Optional
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 # Third-Party
+import aiohttp
 import httpx
+import orjson
 import yaml
 
 # First-Party
+from mcpgateway.config import settings
 from mcpgateway.schemas import ToolCreate
 
+try:
+    # Third-Party
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    # PyYAML built without libyaml bindings
+    # Third-Party
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Patterns used to derive tool names
+_PATH_BRACE_DELETE = str.maketrans("", "", "{}")
+_PATH_SEPARATOR_RUN_RE = re.compile(r"[/\-\._]+")
+
+# Operation keys of a path item that are converted into tools
+# (head/options/trace are skipped: REST tools only support these request types)
+_METHOD_UPPER = {"get": "GET", "post": "POST", "put": "PUT", "delete": "DELETE", "patch": "PATCH"}
+_SUPPORTED_METHODS = frozenset(_METHOD_UPPER)
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Local $refs inside body schemas are redirected to the generated input schema's own "$defs"
+_COMPONENT_SCHEMA_REF_PREFIX = "#/components/schemas/"
+_DEFS_REF_PREFIX = "#/$defs/"
+
+# Shared read-only defaults for lookups of optional spec members, so misses don't allocate
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_SEQUENCE: Tuple[Any, ...] = ()
+
+# Parameter locations exposed as tool input properties (header/cookie parameters are not)
+_SCHEMA_PARAM_LOCATIONS = frozenset({"path", "query"})
+
+# Leading characters inspected to decide whether a spec is JSON
+_JSON_SNIFF_LENGTH = 64
+
+# Specs larger than this are parsed in a worker thread so the event loop keeps serving requests
+_THREAD_PARSE_THRESHOLD = 256 * 1024  # bytes
+
+# Parsed specs, keyed by "url:<url>" (revalidated with ETag/Last-Modified) or "content:<sha256>",
+# mapped to (monotonic insertion time, entry) in LRU order.
+# Only specs up to the thread-parse threshold are kept, which bounds the memory the cache can pin.
+_SPEC_CACHE_SIZE = 32
+_SPEC_CACHE_MAX_SOURCE_BYTES = _THREAD_PARSE_THRESHOLD
+_SPEC_CACHE_TTL = 3600  # seconds
+_spec_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Shared clients for spec fetches so repeated imports reuse pooled connections
+_SPEC_FETCH_TIMEOUT = 30.0  # seconds
+_spec_http_client: Optional[httpx.AsyncClient] = None
+_spec_aiohttp_session: Optional[aiohttp.ClientSession] = None
+
+
+def _spec_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Return a live parsed-spec cache entry and mark it as most recently used.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        The cached entry, or None if missing or older than ``_SPEC_CACHE_TTL``
+
+    Examples:
+        >>> _spec_cache_set("content:doc", {"spec": {}})
+        >>> _spec_cache_get("content:doc")
+        {'spec': {}}
+        >>> _spec_cache_get("content:missing") is None
+        True
+        >>> _spec_cache.clear()
+    """
+    item = _spec_cache.get(key)
+    if item is None:
+        return None
+    stored_at, entry = item
+    if time.monotonic() - stored_at > _SPEC_CACHE_TTL:
+        del _spec_cache[key]
+        return None
+    _spec_cache.move_to_end(key)
+    return entry
+
+
+def _spec_cache_set(key: str, entry: Dict[str, Any]) -> None:
+    """Store a parsed-spec cache entry, evicting the least recently used ones beyond ``_SPEC_CACHE_SIZE``.
+
+    Args:
+        key: Cache key
+        entry: Parsed spec with its revalidation headers
+
+    Examples:
+        >>> for i in range(_SPEC_CACHE_SIZE + 1):
+        ...     _spec_cache_set(f"content:{i}", {"spec": {}})
+        >>> len(_spec_cache), "content:0" in _spec_cache
+        (32, False)
+        >>> _spec_cache.clear()
+    """
+    _spec_cache[key] = (time.monotonic(), entry)
+    _spec_cache.move_to_end(key)
+    while len(_spec_cache) > _SPEC_CACHE_SIZE:
+        _spec_cache.popitem(last=False)
+
+
+async def _get_spec_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client used to fetch OpenAPI specs, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient: Pooled client with keep-alive and HTTP/2 enabled
+    """
+    global _spec_http_client  # pylint: disable=global-statement
+    if _spec_http_client is None or _spec_http_client.is_closed:
+        _spec_http_client = httpx.AsyncClient(
+            timeout=_SPEC_FETCH_TIMEOUT,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _spec_http_client
+
+
+async def _get_spec_aiohttp_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session used to fetch OpenAPI specs, creating it on first use.
+
+    Only used when ``settings.use_aiohttp_for_spec_fetch`` is enabled. Behaves
+    like the httpx client: proxy and CA bundle environment variables
+    (``HTTP(S)_PROXY``, ``NO_PROXY``, ``SSL_CERT_FILE``) are honoured, and the
+    timeout applies to each connect/read operation rather than the whole transfer.
+
+    Returns:
+        aiohttp.ClientSession: Session with a pooled keep-alive connector
+    """
+    global _spec_aiohttp_session  # pylint: disable=global-statement
+    if _spec_aiohttp_session is None or _spec_aiohttp_session.closed:
+        _spec_aiohttp_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=None, connect=_SPEC_FETCH_TIMEOUT, sock_connect=_SPEC_FETCH_TIMEOUT, sock_read=_SPEC_FETCH_TIMEOUT),
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30),
+            trust_env=True,
+        )
+    return _spec_aiohttp_session
+
+
+async def close_openapi_client() -> None:
+    """Close the shared OpenAPI spec HTTP clients, if they were created.
+
+    Examples:
+        >>> import asyncio
+        >>> asyncio.run(close_openapi_client())
+    """
+    global _spec_http_client, _spec_aiohttp_session  # pylint: disable=global-statement
+    if _spec_http_client is not None:
+        await _spec_http_client.aclose()
+        _spec_http_client = None
+    if _spec_aiohttp_session is not None:
+        await _spec_aiohttp_session.close()
+        _spec_aiohttp_session = None
+
+
+async def _fetch_spec_httpx(url: str, headers: Dict[str, str]) -> Tuple[int, bytes, Optional[str], Optional[str]]:
+    """Fetch a spec document with the shared httpx client.
+
+    Args:
+        url: URL of the spec
+        headers: Request headers (conditional revalidation headers, if any)
+
+    Returns:
+        Tuple of (status code, raw body, ETag, Last-Modified)
+
+    Raises:
+        ValueError: If the request times out, fails to connect or returns an error status
+    """
+    try:
+        client = await _get_spec_http_client()
+        response = await client.get(url, headers=headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return response.status_code, b"", None, None
+        response.raise_for_status()
+        return response.status_code, response.content, response.headers.get("etag"), response.headers.get("last-modified")
+    except httpx.TimeoutException as e:
+        raise ValueError(f"Timeout fetching OpenAPI spec from {url}. The server took too long to respond (>30s). Error: {str(e)}")
+    except httpx.HTTPStatusError as e:
+        raise ValueError(f"HTTP error fetching OpenAPI spec from {url}: {e.response.status_code} {e.response.reason_phrase}. The URL may be incorrect or the server is having issues.")
+    except httpx.ConnectError as e:
+        raise ValueError(f"Connection error fetching OpenAPI spec from {url}. Cannot connect to the server. Error: {str(e)}")
+    except httpx.HTTPError as e:
+        raise ValueError(f"Network error fetching OpenAPI spec from {url}: {str(e)}")
+
+
+async def _fetch_spec_aiohttp(url: str, headers: Dict[str, str]) -> Tuple[int, bytes, Optional[str], Optional[str]]:
+    """Fetch a spec document with the shared aiohttp session.
+
+    Mirrors :func:`_fetch_spec_httpx`, including its error messages.
+
+    Args:
+        url: URL of the spec
+        headers: Request headers (conditional revalidation headers, if any)
+
+    Returns:
+        Tuple of (status code, raw body, ETag, Last-Modified)
+
+    Raises:
+        ValueError: If the request times out, fails to connect or returns an error status
+    """
+    try:
+        session = await _get_spec_aiohttp_session()
+        async with session.get(url, headers=headers) as response:
+            if response.status == httpx.codes.NOT_MODIFIED:
+                return response.status, b"", None, None
+            response.raise_for_status()
+            return response.status, await response.read(), response.headers.get("etag"), response.headers.get("last-modified")
+    except asyncio.TimeoutError as e:
+        raise ValueError(f"Timeout fetching OpenAPI spec from {url}. The server took too long to respond (>30s). Error: {str(e)}")
+    except aiohttp.ClientResponseError as e:
+        raise ValueError(f"HTTP error fetching OpenAPI spec from {url}: {e.status} {e.message}. The URL may be incorrect or the server is having issues.")
+    except aiohttp.ClientConnectorError as e:
+        raise ValueError(f"Connection error fetching OpenAPI spec from {url}. Cannot connect to the server. Error: {str(e)}")
+    except aiohttp.ClientError as e:
+        raise ValueError(f"Network error fetching OpenAPI spec from {url}: {str(e)}")
+
+
+def _looks_like_json(document: Union[str, bytes]) -> bool:
+    """Check whether a spec document starts like JSON (first non-blank character is ``{`` or ``[``).
+
+    Only a short prefix is inspected, so the check is O(1) regardless of spec size.
+
+    Args:
+        document: Raw spec content as text or bytes
+
+    Returns:
+        True if the document should be tried as JSON first
+
+    Examples:
+        >>> _looks_like_json('  {"openapi": "3.0.0"}')
+        True
+        >>> _looks_like_json(b'\\n[]')
+        True
+        >>> _looks_like_json('openapi: 3.0.0')
+        False
+    """
+    head = document[:_JSON_SNIFF_LENGTH].lstrip()
+    return head.startswith((b"{", b"[") if isinstance(document, bytes) else ("{", "["))
+
+
+def _load_spec_document(document: Union[str, bytes]) -> Any:
+    """Deserialize an OpenAPI document, using the orjson fast path for JSON.
+
+    Documents that look like JSON are parsed by orjson. Everything else, and
+    JSON that orjson rejects, is handed to the YAML loader (libyaml C loader
+    when available, same safe semantics as ``yaml.safe_load``), which also
+    accepts JSON and reports errors with line/column information.
+
+    Args:
+        document: Raw spec content as text or bytes
+
+    Returns:
+        Deserialized document
+
+    Raises:
+        yaml.YAMLError: If the document is neither valid JSON nor valid YAML
+
+    Examples:
+        >>> _load_spec_document('{"openapi": "3.0.0"}')
+        {'openapi': '3.0.0'}
+        >>> _load_spec_document(b'openapi: 3.0.0')
+        {'openapi': '3.0.0'}
+    """
+    if _looks_like_json(document):
+        try:
+            return orjson.loads(document)
+        except orjson.JSONDecodeError:
+            pass  # Let the YAML loader produce a located error (or accept YAML flow syntax)
+    return yaml.load(document, Loader=_YamlLoader)  # nosec B506 - loader is CSafeLoader/SafeLoader
 
-async def parse_openapi_spec(url: Optional[str] = None, content: Optional[str] = None) -> dict:
+
+async def parse_openapi_spec(url: Optional[str] = None, content: Optional[Union[str, bytes]] = None) -> dict:
     """Parse OpenAPI specification from URL or direct content.
 
+    Parsed specs up to 256 KiB are cached. Direct content is keyed by its
+    SHA-256 digest; URL fetches are revalidated with ``If-None-Match``/
+    ``If-Modified-Since`` and a ``304 Not Modified`` response reuses the cached
+    spec without re-parsing. Responses without an ``ETag`` or ``Last-Modified``
+    header are not cached. The returned dictionary may be shared with the
+    cache and must be treated as read-only.
+
     Args:
         url: URL to fetch OpenAPI YAML specification from
-        content: Direct YAML content as string
+        content: Direct YAML/JSON content, as text or as raw UTF-8 (optionally BOM-prefixed) bytes
 
     Returns:
         Parsed OpenAPI specification as dictionary
@@ -62,28 +345,48 @@ async def parse_openapi_spec(url: Optional[str] = None, content: Optional[str] =
 
     try:
         if url:
+            cache_key = f"url:{url}"
+            cached = _spec_cache_get(cache_key)
+            request_headers = {}
+            if cached:
+                if cached["etag"]:
+                    request_headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    request_headers["If-Modified-Since"] = cached["last_modified"]
+
             logger.info(f"Fetching OpenAPI spec from URL: {url}")
-            try:
-                async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    spec_content = response.text
-                    logger.info(f"Fetched {len(spec_content)} bytes from {url}")
-            except httpx.TimeoutException as e:
-                raise ValueError(f"Timeout fetching OpenAPI spec from {url}. The server took too long to respond (>30s). Error: {str(e)}")
-            except httpx.HTTPStatusError as e:
-                raise ValueError(f"HTTP error fetching OpenAPI spec from {url}: {e.response.status_code} {e.response.reason_phrase}. The URL may be incorrect or the server is having issues.")
-            except httpx.ConnectError as e:
-                raise ValueError(f"Connection error fetching OpenAPI spec from {url}. Cannot connect to the server. Error: {str(e)}")
-            except httpx.HTTPError as e:
-                raise ValueError(f"Network error fetching OpenAPI spec from {url}: {str(e)}")
+            fetch = _fetch_spec_aiohttp if settings.use_aiohttp_for_spec_fetch else _fetch_spec_httpx
+            # The raw body goes to the loader (it detects UTF-8/UTF-16) instead of keeping a decoded str copy
+            status, spec_content, etag, last_modified = await fetch(url, request_headers)
+            if cached and status == httpx.codes.NOT_MODIFIED:
+                logger.info(f"OpenAPI spec at {url} not modified, using cached copy")
+                return cached["spec"]
+            logger.info(f"Fetched {len(spec_content)} bytes from {url}")
+            # Entries that cannot be revalidated would only pin memory
+            cacheable = len(spec_content) <= _SPEC_CACHE_MAX_SOURCE_BYTES and bool(etag or last_modified)
         else:
+            # Content too large to be cached is neither encoded nor hashed (a str never has more characters than UTF-8 bytes)
+            cache_key = None
+            if len(content) <= _SPEC_CACHE_MAX_SOURCE_BYTES:
+                # Bytes are hashed undecoded; the loader handles the BOM and rejects invalid UTF-8 itself
+                raw_content = content if isinstance(content, bytes) else content.encode()
+                if len(raw_content) <= _SPEC_CACHE_MAX_SOURCE_BYTES:
+                    cache_key = f"content:{hashlib.sha256(raw_content).hexdigest()}"
+            cached = _spec_cache_get(cache_key) if cache_key else None
+            if cached:
+                logger.info("Using cached parse of identical OpenAPI spec content")
+                return cached["spec"]
+            cacheable = cache_key is not None
             spec_content = content
+            etag = last_modified = None
             logger.info(f"Parsing OpenAPI spec from direct content ({len(spec_content)} bytes)")
 
-        # Parse YAML
+        # Parse JSON or YAML
         try:
-            spec = yaml.safe_load(spec_content)
+            if len(spec_content) > _THREAD_PARSE_THRESHOLD:
+                spec = await asyncio.to_thread(_load_spec_document, spec_content)
+            else:
+                spec = _load_spec_document(spec_content)
         except yaml.YAMLError as e:
             # Get line number if available
             if hasattr(e, "problem_mark"):
@@ -101,6 +404,11 @@ async def parse_openapi_spec(url: Optional[str] = None, content: Optional[str] =
 
         openapi_version = spec.get("openapi") or spec.get("swagger")
         logger.info(f"Successfully parsed OpenAPI spec v{openapi_version}: {spec.get('info', {}).get('title', 'Unknown')}")
+        if cacheable:
+            _spec_cache_set(cache_key, {"spec": spec, "etag": etag, "last_modified": last_modified})
+        elif cache_key:
+            # Not worth keeping; also drops an earlier version fetched from the same URL
+            _spec_cache.pop(cache_key, None)
         return spec
 
     except ValueError:
@@ -184,7 +492,7 @@ def extract_security_config(spec: dict) -> Dict[str, Any]:
         >>> config['header_name']
         'X-API-KEY'
     """
-    security_schemes = spec.get("components", {}).get("securitySchemes", {})
+    security_schemes = spec.get("components", _EMPTY_MAPPING).get("securitySchemes", _EMPTY_MAPPING)
 
     if not security_schemes:
         logger.info("No security schemes found in OpenAPI spec")
@@ -243,32 +551,294 @@ def generate_tool_name(method: str, path: str, namespace: Optional[str] = None)
         >>> generate_tool_name("GET", "/api/v1/users/{user-id}/posts")
         'get_api_v1_users_user_id_posts'
     """
-    # Remove leading slash and replace special characters
-    clean_path = path.lstrip("/")
+    # Remove leading slash and curly braces (keeping parameter names)
+    clean_path = path.lstrip("/").translate(_PATH_BRACE_DELETE)
+
+    # Collapse each run of separators/underscores into a single underscore, drop any trailing one
+    clean_path = _PATH_SEPARATOR_RUN_RE.sub("_", clean_path).rstrip("_")
+
+    # Join the optional namespace prefix, method and path in one step (empty parts are dropped)
+    return "_".join([part for part in (namespace, method.lower(), clean_path) if part])
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_path_params(path: str) -> Tuple[str, ...]:
+    """Extract ``{param}`` placeholder names from an API path.
+
+    Memoized per path: the operations sharing a path (GET/PUT/DELETE on
+    ``/pet/{petId}``) and re-imports of the same spec scan it only once.
+
+    Args:
+        path: API path with parameter placeholders
+
+    Returns:
+        Placeholder names in order of appearance
+
+    Examples:
+        >>> _extract_path_params('/users/{userId}/posts/{postId}')
+        ('userId', 'postId')
+        >>> _extract_path_params('/store/inventory')
+        ()
+        >>> _extract_path_params('/files/{file-id}/{a{b}}')
+        ('b',)
+    """
+    params = []
+    find = path.find
+    start = find("{")
+    while start >= 0:
+        end = find("}", start + 1)
+        if end < 0:
+            break
+        name = path[start + 1 : end]
+        # Same acceptance as r"\{(\w+)\}": a non-empty run of word characters
+        if name.replace("_", "a").isalnum():
+            params.append(name)
+            start = find("{", end + 1)
+        else:
+            start = find("{", start + 1)
+    return tuple(params)
+
+
+def _resolve_ref(spec: dict, node: Any, resolved: Dict[str, Any]) -> Any:
+    """Follow local JSON references (``{"$ref": "#/components/..."}``) to their target.
+
+    Chained references are followed until a non-reference node is reached.
+    External, dangling and circular references are returned unchanged. Every
+    reference string is looked up at most once per ``resolved`` memo; the
+    target itself is not copied or expanded here.
+
+    Args:
+        spec: Parsed OpenAPI specification the references point into
+        node: Node that may be a reference object
+        resolved: Memo of already resolved reference strings
+
+    Returns:
+        The referenced node, or ``node`` itself when it is not a resolvable local reference
+
+    Examples:
+        >>> spec = {'components': {'schemas': {'Pet': {'type': 'object'}, 'Alias': {'$ref': '#/components/schemas/Pet'}}}}
+        >>> memo = {}
+        >>> _resolve_ref(spec, {'$ref': '#/components/schemas/Alias'}, memo)
+        {'type': 'object'}
+        >>> sorted(memo)
+        ['#/components/schemas/Alias', '#/components/schemas/Pet']
+        >>> _resolve_ref(spec, {'$ref': 'other.yaml#/Pet'}, memo)
+        {'$ref': 'other.yaml#/Pet'}
+        >>> _resolve_ref(spec, {'type': 'string'}, memo)
+        {'type': 'string'}
+    """
+    chain: List[str] = []
+    target = node
+    while isinstance(target, dict) and isinstance(target.get("$ref"), str):
+        ref = target["$ref"]
+        if ref in resolved:
+            target = resolved[ref]
+            break
+        if not ref.startswith("#/") or ref in chain:
+            # External or circular reference: leave the original node untouched
+            return node
+        chain.append(ref)
+        pointee: Any = spec
+        for token in ref[2:].split("/"):
+            token = token.replace("~1", "/").replace("~0", "~")
+            if not isinstance(pointee, dict) or token not in pointee:
+                logger.debug(f"Unresolvable $ref in OpenAPI spec: {ref}")
+                return node
+            pointee = pointee[token]
+        target = pointee
+
+    for ref in chain:
+        resolved[ref] = target
+    return target
+
+
+def _keep_ref(node: Any) -> Any:
+    """Leave nodes untouched; the default resolver when no spec is available.
+
+    Args:
+        node: Node that may be a reference object
+
+    Returns:
+        The same node
+
+    Examples:
+        >>> _keep_ref({'$ref': '#/components/schemas/Pet'})
+        {'$ref': '#/components/schemas/Pet'}
+    """
+    return node
+
+
+def _defs_pointer(ref: str, defs: Dict[str, Any], pending: List[Tuple[str, str]]) -> str:
+    """Register a local reference for the input schema's ``$defs`` and return its new pointer.
+
+    Component schemas keep their name (``#/components/schemas/Pet`` becomes
+    ``#/$defs/Pet``); other local pointers are keyed by their path below ``#/``.
+
+    Args:
+        ref: Resolvable local reference string
+        defs: ``$defs`` being built; keys are reserved here and filled in later
+        pending: Queue of (key, reference) pairs still to be copied into ``defs``
+
+    Returns:
+        JSON pointer to the ``$defs`` entry
+
+    Examples:
+        >>> defs, pending = {}, []
+        >>> _defs_pointer('#/components/schemas/Pet', defs, pending)
+        '#/$defs/Pet'
+        >>> _defs_pointer('#/components/schemas/Pet', defs, pending), pending
+        ('#/$defs/Pet', [('Pet', '#/components/schemas/Pet')])
+        >>> _defs_pointer('#/components/requestBodies/Pet', defs, pending)
+        '#/$defs/components~1requestBodies~1Pet'
+    """
+    key = ref[len(_COMPONENT_SCHEMA_REF_PREFIX) :] if ref.startswith(_COMPONENT_SCHEMA_REF_PREFIX) else ref[2:]
+    if key not in defs:
+        defs[key] = None
+        pending.append((key, ref))
+    return _DEFS_REF_PREFIX + key.replace("~", "~0").replace("/", "~1")
+
+
+def _copy_schema(node: Any, resolve_ref: Callable[[Any], Any], defs: Dict[str, Any], pending: List[Tuple[str, str]]) -> Any:
+    """Return a copy of a schema node with local ``$ref`` pointers redirected to ``$defs``.
+
+    Generated input schemas are validated without the spec around them, so
+    pointers such as ``#/components/schemas/Category`` must not survive as-is.
+    Referenced schemas are not inlined: each one is registered once in ``defs``
+    and copied later by :func:`_build_defs`, so shared and recursive components
+    keep the generated schema linear in the size of the spec and shallow. The
+    result never aliases containers of the (possibly cached) spec.
+
+    External and dangling references are replaced by their sibling keywords,
+    i.e. a permissive schema.
+
+    Args:
+        node: Schema node to copy
+        resolve_ref: Resolver for reference objects; with :func:`_keep_ref` references are copied verbatim
+        defs: ``$defs`` being built for the input schema
+        pending: Queue of (key, reference) pairs still to be copied into ``defs``
+
+    Returns:
+        Copied node
+
+    Examples:
+        >>> spec = {'components': {'schemas': {'Tag': {'type': 'object'}}}}
+        >>> resolve = functools.partial(_resolve_ref, spec, resolved={})
+        >>> defs, pending = {}, []
+        >>> _copy_schema({'type': 'array', 'items': {'$ref': '#/components/schemas/Tag'}}, resolve, defs, pending)
+        {'type': 'array', 'items': {'$ref': '#/$defs/Tag'}}
+        >>> _copy_schema({'$ref': 'other.yaml#/Pet', 'description': 'Owner'}, resolve, defs, pending)
+        {'description': 'Owner'}
+        >>> pending
+        [('Tag', '#/components/schemas/Tag')]
+    """
+    if isinstance(node, list):
+        return [_copy_schema(item, resolve_ref, defs, pending) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    ref = node.get("$ref")
+    if not isinstance(ref, str) or resolve_ref is _keep_ref:
+        return {key: _copy_schema(value, resolve_ref, defs, pending) for key, value in node.items()}
+
+    # Unresolvable references drop the pointer and keep what the reference object itself says
+    copied = {key: _copy_schema(value, resolve_ref, defs, pending) for key, value in node.items() if key != "$ref"}
+    if resolve_ref(node) is not node:
+        copied["$ref"] = _defs_pointer(ref, defs, pending)
+    return copied
+
 
-    # Replace path separators and special characters with underscores
-    clean_path = re.sub(r"[/\-\.]", "_", clean_path)
+def _build_defs(resolve_ref: Callable[[Any], Any], defs: Dict[str, Any], pending: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """Copy every schema reachable from the registered references into ``defs``.
 
-    # Remove curly braces but keep parameter names
-    clean_path = re.sub(r"[{}]", "", clean_path)
+    Each referenced schema is copied exactly once, however many times (or
+    however deeply) it is referenced.
 
-    # Remove multiple consecutive underscores
-    clean_path = re.sub(r"_+", "_", clean_path)
+    Args:
+        resolve_ref: Resolver for reference objects
+        defs: ``$defs`` being built for the input schema
+        pending: Queue of (key, reference) pairs still to be copied; drained here
 
-    # Remove trailing underscore
-    clean_path = clean_path.rstrip("_")
+    Returns:
+        The completed ``defs`` mapping
 
-    # Build tool name
-    tool_name = f"{method.lower()}_{clean_path}" if clean_path else method.lower()
+    Examples:
+        >>> spec = {'components': {'schemas': {'Node': {'type': 'object', 'properties': {'next': {'$ref': '#/components/schemas/Node'}}}}}}
+        >>> resolve = functools.partial(_resolve_ref, spec, resolved={})
+        >>> defs, pending = {}, []
+        >>> _copy_schema({'$ref': '#/components/schemas/Node'}, resolve, defs, pending)
+        {'$ref': '#/$defs/Node'}
+        >>> _build_defs(resolve, defs, pending)
+        {'Node': {'type': 'object', 'properties': {'next': {'$ref': '#/$defs/Node'}}}}
+    """
+    while pending:
+        key, ref = pending.pop()
+        defs[key] = _copy_schema(resolve_ref({"$ref": ref}), resolve_ref, defs, pending)
+    return defs
 
-    # Add namespace prefix if provided
-    if namespace:
-        tool_name = f"{namespace}_{tool_name}"
 
-    return tool_name
+def _is_json_media_type(media_type: str) -> bool:
+    """Check whether a requestBody media type carries JSON.
+
+    Matches ``application/json`` and structured ``application/*+json`` types,
+    ignoring case and media-type parameters. Plain string operations, so the
+    cost is linear in the key length whatever the spec contains.
+
+    Args:
+        media_type: Key of an OpenAPI ``content`` map
 
+    Returns:
+        True for JSON media types
+
+    Examples:
+        >>> _is_json_media_type('application/json; charset=utf-8')
+        True
+        >>> _is_json_media_type('application/merge-patch+json')
+        True
+        >>> _is_json_media_type('application/x-www-form-urlencoded')
+        False
+        >>> _is_json_media_type('text/json+xml')
+        False
+    """
+    essence = media_type.partition(";")[0].strip().lower()
+    return essence == "application/json" or (essence.startswith("application/") and essence.endswith("+json"))
+
+
+def _select_json_media(content: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Pick the JSON media type object of a requestBody ``content`` map.
+
+    An exact ``application/json`` entry wins; otherwise the first JSON media
+    type in spec order is used.
+
+    Args:
+        content: OpenAPI ``content`` map
+
+    Returns:
+        The media type object, or an empty mapping if the body has no JSON representation
 
-def path_to_input_schema(path: str, parameters: Optional[List[Dict[str, Any]]] = None, request_body: Optional[Dict[str, Any]] = None, method: str = "GET") -> Dict[str, Any]:
+    Examples:
+        >>> _select_json_media({'application/xml': {}, 'application/json': {'schema': {'type': 'object'}}})
+        {'schema': {'type': 'object'}}
+        >>> _select_json_media({'application/vnd.api+json': {'schema': {'type': 'array'}}})
+        {'schema': {'type': 'array'}}
+        >>> dict(_select_json_media({'text/plain': {}}))
+        {}
+    """
+    media = content.get("application/json")
+    if media is not None:
+        return media
+    for media_type, media in content.items():
+        if isinstance(media_type, str) and _is_json_media_type(media_type):
+            return media
+    return _EMPTY_MAPPING
+
+
+def path_to_input_schema(
+    path: str,
+    parameters: Optional[List[Dict[str, Any]]] = None,
+    request_body: Optional[Dict[str, Any]] = None,
+    method: str = "GET",
+    resolve_ref: Optional[Callable[[Any], Any]] = None,
+) -> Dict[str, Any]:
     """Convert OpenAPI path parameters and request body to JSON Schema.
 
     Args:
@@ -276,6 +846,10 @@ def path_to_input_schema(path: str, parameters: Optional[List[Dict[str, Any]]] =
         parameters: OpenAPI parameters array
         request_body: OpenAPI requestBody object
         method: HTTP method
+        resolve_ref: Optional callable that replaces ``$ref`` objects (parameters,
+            request body, parameter and body schemas) with their targets;
+            references nested inside body schemas are redirected to copies of
+            their targets under the returned schema's ``$defs``
 
     Returns:
         JSON Schema for tool input validation
@@ -301,71 +875,200 @@ def path_to_input_schema(path: str, parameters: Optional[List[Dict[str, Any]]] =
         >>> schema['properties']['status']['enum']
         ['available', 'sold']
     """
-    schema = {"type": "object", "properties": {}, "required": []}
-
     # Extract path parameters from the path itself
-    path_params = re.findall(r"\{(\w+)\}", path)
+    path_params = _extract_path_params(path)
+
+    # Nothing to describe (e.g. parameterless GETs): skip the per-input bookkeeping
+    if not parameters and not path_params and not request_body:
+        return {"type": "object", "properties": {}, "required": []}
+
+    properties: Dict[str, Any] = {}
+    # Insertion-ordered set: O(1) membership/dedup, stable order in the emitted list
+    required: Dict[str, None] = {}
+    # Schemas referenced from the request body, emitted once under "$defs"
+    defs: Dict[str, Any] = {}
+
+    if resolve_ref is None:
+        resolve_ref = _keep_ref
 
     # Process parameters array
     if parameters:
         for param in parameters:
+            param = resolve_ref(param)
             param_name = param.get("name")
+
+            # External, dangling or circular references stay unresolved and carry no usable name
+            if "$ref" in param or not isinstance(param_name, str):
+                logger.debug(f"Skipping unresolvable OpenAPI parameter in {path}: {param.get('$ref', param)}")
+                continue
+
             param_in = param.get("in", "query")
-            param_schema = param.get("schema", {})
-            param_required = param.get("required", False)
-            param_description = param.get("description", "")
 
             # Only include path and query parameters
-            if param_in in ["path", "query"]:
-                schema["properties"][param_name] = {
-                    "type": param_schema.get("type", "string"),
-                    "description": param_description,
-                }
+            if param_in not in _SCHEMA_PARAM_LOCATIONS:
+                continue
 
-                # Add enum if present
-                if "enum" in param_schema:
-                    schema["properties"][param_name]["enum"] = param_schema["enum"]
+            param_schema = resolve_ref(param.get("schema", _EMPTY_MAPPING))
+            prop = {"type": param_schema.get("type", "string"), "description": param.get("description", "")}
 
-                # Add default if present
-                if "default" in param_schema:
-                    schema["properties"][param_name]["default"] = param_schema["default"]
+            # Add enum and default if present (copied, so the schema never aliases the spec)
+            if "enum" in param_schema:
+                prop["enum"] = copy.deepcopy(param_schema["enum"])
+            if "default" in param_schema:
+                prop["default"] = copy.deepcopy(param_schema["default"])
+            properties[param_name] = prop
 
-                # Mark as required
-                if param_required or param_in == "path":
-                    schema["required"].append(param_name)
+            # Mark as required
+            if param_in == "path" or param.get("required", False):
+                required[param_name] = None
 
     # Add path parameters not in parameters array
     for path_param in path_params:
-        if path_param not in schema["properties"]:
-            schema["properties"][path_param] = {"type": "string", "description": f"Path parameter: {path_param}"}
-            if path_param not in schema["required"]:
-                schema["required"].append(path_param)
+        if path_param not in properties:
+            properties[path_param] = {"type": "string", "description": f"Path parameter: {path_param}"}
+            required[path_param] = None
 
     # Process request body for POST, PUT, PATCH
-    if request_body and method.upper() in ["POST", "PUT", "PATCH"]:
-        content = request_body.get("content", {})
-        json_content = content.get("application/json", {})
+    if request_body and method.upper() in _BODY_METHODS:
+        request_body = resolve_ref(request_body)
+        content = request_body.get("content", _EMPTY_MAPPING)
+        json_content = _select_json_media(content)
 
         if json_content and "schema" in json_content:
-            body_schema = json_content["schema"]
+            # Deep copy with nested $refs pointing into "$defs"
+            pending: List[Tuple[str, str]] = []
+            body_schema = _copy_schema(resolve_ref(json_content["schema"]), resolve_ref, defs, pending)
+            _build_defs(resolve_ref, defs, pending)
 
             # If body schema has properties, add them directly
             if "properties" in body_schema:
-                for prop_name, prop_schema in body_schema["properties"].items():
-                    schema["properties"][prop_name] = prop_schema
+                properties.update(body_schema["properties"])
 
                 # Add required fields from body
                 if "required" in body_schema:
-                    schema["required"].extend(body_schema["required"])
+                    required.update(dict.fromkeys(body_schema["required"]))
             else:
                 # Entire body as a single property
-                schema["properties"]["body"] = body_schema
+                properties["body"] = body_schema
                 if request_body.get("required", False):
-                    schema["required"].append("body")
+                    required["body"] = None
 
+    schema = {"type": "object", "properties": properties, "required": list(required)}
+    if defs:
+        schema["$defs"] = defs
     return schema
 
 
+def _build_tool(
+    path: str,
+    method: str,
+    operation: Dict[str, Any],
+    url_prefix: str,
+    tool_defaults: Dict[str, Any],
+    name_prefix: str,
+    resolve_ref: Optional[Callable[[Any], Any]] = None,
+) -> ToolCreate:
+    """Build the ToolCreate definition for a single OpenAPI operation.
+
+    Args:
+        path: API path of the operation (e.g., /pet/{petId})
+        method: Lowercase HTTP method of the operation
+        operation: OpenAPI operation object
+        url_prefix: Base URL for API endpoints, with exactly one trailing slash
+        tool_defaults: ToolCreate fields shared by every tool of the spec (integration type, auth headers)
+        name_prefix: Namespace prefix including its separator (``"petstore_"``), or ``""``
+        resolve_ref: Optional ``$ref`` resolver for the operation's parameters and request body
+
+    Returns:
+        ToolCreate object for the operation
+
+    Examples:
+        >>> tool = _build_tool('/users', 'get', {'summary': 'List users'}, 'https://api.example.com/', {'integration_type': 'REST'}, '')
+        >>> (tool.name, tool.url, tool.request_type)
+        ('get_users', 'https://api.example.com/users', 'GET')
+    """
+    method_upper = _METHOD_UPPER[method]
+
+    # Generate tool name (use operationId if set, otherwise generate); the namespace prefix is applied once for both
+    tool_name = name_prefix + (operation.get("operationId") or generate_tool_name(method_upper, path))
+
+    # Build full URL (plain concatenation; only an absolute "path", invalid in OpenAPI, needs urljoin)
+    relative_path = path.lstrip("/")
+    full_url = urljoin(url_prefix, relative_path) if relative_path.startswith(("http://", "https://")) else url_prefix + relative_path
+
+    # Get description
+    description = operation.get("summary") or operation.get("description") or f"{method_upper} {path}"
+
+    # Build input schema
+    parameters = operation.get("parameters", _EMPTY_SEQUENCE)
+    request_body = operation.get("requestBody")
+    input_schema = path_to_input_schema(path, parameters, request_body, method_upper, resolve_ref=resolve_ref)
+
+    # Create ToolCreate object. Keep full validation (no model_construct): names, summaries and descriptions
+    # come from an untrusted spec and must be sanitized, and the validators also derive base_url/path_template
+    tool = ToolCreate(
+        **tool_defaults,
+        name=tool_name,
+        displayName=operation.get("summary", tool_name),
+        url=full_url,
+        description=description,
+        request_type=method_upper,
+        input_schema=input_schema,
+        tags=operation.get("tags"),  # None is normalized to a fresh [] by the tags validator
+    )
+
+    logger.debug(f"Created tool definition: {tool_name} ({method_upper} {path})")
+    return tool
+
+
+def _build_auth_headers(auth_config: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """Build the request headers shared by every tool generated from one spec.
+
+    Only API-key auth contributes a header; its value is a placeholder that has
+    to be provided at runtime.
+
+    Args:
+        auth_config: Authentication configuration from :func:`extract_security_config`
+
+    Returns:
+        Header dictionary, or None when the auth scheme needs no static header
+
+    Examples:
+        >>> _build_auth_headers({"auth_type": "apiKey", "header_name": "X-Token"})
+        {'X-Token': 'PLACEHOLDER_API_KEY'}
+        >>> _build_auth_headers({"auth_type": "bearer"}) is None
+        True
+    """
+    if auth_config.get("auth_type") == "apiKey":
+        return {auth_config.get("header_name", "X-API-KEY"): "PLACEHOLDER_API_KEY"}
+    return None
+
+
+def _iter_operations(paths: Dict[str, Any]) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """Yield every convertible operation of an OpenAPI ``paths`` object, in spec order.
+
+    Vendor extensions (``x-*`` keys) of the paths object are skipped without
+    being inspected; only the operation keys of each path item are read.
+
+    Args:
+        paths: OpenAPI paths object
+
+    Yields:
+        Tuples of (path, lowercase method, operation object)
+
+    Examples:
+        >>> paths = {'/pets': {'parameters': [], 'get': {}, 'post': {}}, '/health': {'head': {}}, 'x-internal': {'get': {}}}
+        >>> [(path, method) for path, method, _ in _iter_operations(paths)]
+        [('/pets', 'get'), ('/pets', 'post')]
+    """
+    for path, path_item in paths.items():
+        if path.startswith("x-") or not isinstance(path_item, dict):
+            continue
+        for method, operation in path_item.items():
+            if method in _SUPPORTED_METHODS:
+                yield path, method, operation
+
+
 def convert_openapi_to_tools(spec: dict, base_url: str, auth_config: Dict[str, Any], namespace: Optional[str] = None) -> List[ToolCreate]:
     """Convert OpenAPI specification to list of ToolCreate objects.
 
@@ -400,7 +1103,7 @@ def convert_openapi_to_tools(spec: dict, base_url: str, auth_config: Dict[str, A
         >>> len(tools)
         1
         >>> tools[0].name
-        'get_pet_petId'
+        'getPetById'
         >>> tools[0].integration_type
         'REST'
     """
@@ -409,59 +1112,16 @@ def convert_openapi_to_tools(spec: dict, base_url: str, auth_config: Dict[str, A
     if not paths:
         raise ValueError("No paths defined in OpenAPI specification")
 
-    tools = []
-    supported_methods = ["get", "post", "put", "delete", "patch"]
+    # Fields shared by every tool built from this spec
+    url_prefix = base_url.rstrip("/") + "/"
+    name_prefix = f"{namespace}_" if namespace else ""
+    tool_defaults = {"integration_type": "REST", "headers": _build_auth_headers(auth_config)}
 
-    # Prepare headers for auth
-    headers = {}
-    if auth_config.get("auth_type") == "apiKey":
-        # Note: Actual value needs to be provided at runtime
-        # We just define the header name here
-        header_name = auth_config.get("header_name", "X-API-KEY")
-        headers[header_name] = "PLACEHOLDER_API_KEY"
-
-    for path, path_item in paths.items():
-        for method in supported_methods:
-            if method not in path_item:
-                continue
-
-            operation = path_item[method]
+    # Local $refs are resolved on demand, each shared component only once per spec
+    resolve_ref = functools.partial(_resolve_ref, spec, resolved={})
 
-            # Generate tool name (use operationId if available, otherwise generate)
-            if "operationId" in operation:
-                tool_name = operation["operationId"]
-                # Add namespace if provided
-                if namespace:
-                    tool_name = f"{namespace}_{tool_name}"
-            else:
-                tool_name = generate_tool_name(method.upper(), path, namespace)
-
-            # Build full URL
-            full_url = urljoin(base_url + "/", path.lstrip("/"))
-
-            # Get description
-            description = operation.get("summary") or operation.get("description") or f"{method.upper()} {path}"
-
-            # Build input schema
-            parameters = operation.get("parameters", [])
-            request_body = operation.get("requestBody")
-            input_schema = path_to_input_schema(path, parameters, request_body, method.upper())
-
-            # Create ToolCreate object
-            tool = ToolCreate(
-                name=tool_name,
-                displayName=operation.get("summary", tool_name),
-                url=full_url,
-                description=description,
-                integration_type="REST",
-                request_type=method.upper(),
-                headers=headers if headers else None,
-                input_schema=input_schema,
-                tags=operation.get("tags", []),
-            )
-
-            tools.append(tool)
-            logger.debug(f"Created tool definition: {tool_name} ({method.upper()} {path})")
+    # Each operation is built independently of the others, straight from the flat operation stream
+    tools = [_build_tool(path, method, operation, url_prefix, tool_defaults, name_prefix, resolve_ref) for path, method, operation in _iter_operations(paths)]
 
     logger.info(f"Converted {len(tools)} endpoints to tool definitions")
     return tools
@@ -24,6 +24,16 @@ def test_utc_now_returns_utc_datetime():
     assert now.tzinfo == timezone.utc
 
 
+# --- JSON column serializer ---
+def test_engine_uses_orjson_serializer():
+    assert db.engine.dialect._json_serializer is db._json_serializer
+    assert db._json_serializer({"properties": {"id": {"type": "integer"}}, 1: "x"}) == '{"properties":{"id":{"type":"integer"}},"1":"x"}'
+
+
+def test_json_serializer_falls_back_to_stdlib():
+    assert db._json_serializer([2**70]) == "[1180591620717411303424]"
+
+
 # --- Tool metrics properties ---
 def make_tool_with_metrics(metrics):
     tool = db.Tool()
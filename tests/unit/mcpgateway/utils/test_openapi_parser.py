@@ -7,10 +7,40 @@ Authors: Mihai Criveti
 Unit tests for OpenAPI parser utility.
 """
 
+# Standard
+import asyncio
+import copy
+from unittest.mock import patch
+
+# Third-Party
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import httpx
+import jsonschema
+import orjson
 import pytest
 
+# First-Party
+from mcpgateway.utils import openapi_parser
 from mcpgateway.utils.openapi_parser import convert_openapi_to_tools, extract_base_url, extract_security_config, generate_tool_name, parse_openapi_spec, path_to_input_schema
 
+SIMPLE_SPEC_YAML = """
+openapi: 3.0.0
+info:
+  title: Cached API
+  version: 1.0.0
+paths: {}
+"""
+
+
+@pytest.fixture(autouse=True)
+async def reset_parser_state():
+    """Isolate tests from cached specs and the shared HTTP client."""
+    openapi_parser._spec_cache.clear()
+    yield
+    openapi_parser._spec_cache.clear()
+    await openapi_parser.close_openapi_client()
+
 
 class TestGenerateToolName:
     """Test tool name generation from HTTP method and path."""
@@ -41,6 +71,13 @@ class TestGenerateToolName:
     def test_root_path(self):
         """Test root path."""
         assert generate_tool_name("GET", "/") == "get"
+        assert generate_tool_name("GET", "/", namespace="petstore") == "petstore_get"
+
+    def test_dots_and_separator_runs(self):
+        """Test dots, repeated separators and trailing slashes collapse to single underscores."""
+        assert generate_tool_name("GET", "/v1.2/files/{file_id}.json") == "get_v1_2_files_file_id_json"
+        assert generate_tool_name("GET", "/a//b--c__d/") == "get_a_b_c_d"
+        assert generate_tool_name("PUT", "/{id}") == "put_id"
 
 
 class TestExtractBaseUrl:
@@ -92,6 +129,30 @@ class TestExtractSecurityConfig:
         config = extract_security_config(spec)
         assert config["auth_type"] == "basic"
 
+    def test_unhashable_scheme_fields(self):
+        """Test that non-scalar scheme fields are passed through instead of breaking extraction."""
+        spec = {"components": {"securitySchemes": {"bearer": {"type": "http", "scheme": "bearer", "bearerFormat": ["JWT"]}}}}
+        assert extract_security_config(spec) == {"auth_type": "bearer", "bearer_format": ["JWT"]}
+
+    def test_returned_mapping_not_shared(self):
+        """Test that repeated extraction returns independent dicts."""
+        spec = {"components": {"securitySchemes": {"bearer": {"type": "http", "scheme": "bearer"}}}}
+        first = extract_security_config(spec)
+        first["auth_type"] = "changed"
+
+        second = extract_security_config(spec)
+        assert second == {"auth_type": "bearer", "bearer_format": "JWT"}
+
+    def test_reflects_each_spec_object(self):
+        """Test that results follow the spec's contents, even when a freed spec's id() is reused."""
+        header_names = [extract_security_config({"components": {"securitySchemes": {"key": {"type": "apiKey", "name": f"X-Key-{i}"}}}})["header_name"] for i in range(3)]
+        assert header_names == ["X-Key-0", "X-Key-1", "X-Key-2"]
+
+        spec = {"components": {"securitySchemes": {"basic": {"type": "http", "scheme": "basic"}}}}
+        assert extract_security_config(spec)["auth_type"] == "basic"
+        spec["components"]["securitySchemes"] = {"bearer": {"type": "http", "scheme": "bearer"}}
+        assert extract_security_config(spec)["auth_type"] == "bearer"
+
     def test_no_security(self):
         """Test when no security schemes defined."""
         spec = {"components": {}}
@@ -132,6 +193,16 @@ class TestPathToInputSchema:
         assert "age" in schema["properties"]
         assert "name" in schema["required"]
 
+    def test_request_body_json_media_type_variants(self):
+        """Test that JSON bodies declared with parameters or as +json types are recognized."""
+        for media_type in ("application/json; charset=utf-8", "application/merge-patch+json", "Application/JSON"):
+            request_body = {"content": {"application/xml": {"schema": {"type": "string"}}, media_type: {"schema": {"type": "object", "properties": {"name": {"type": "string"}}}}}}
+            schema = path_to_input_schema("/pets", request_body=request_body, method="PATCH")
+            assert list(schema["properties"]) == ["name"], media_type
+
+        request_body = {"content": {"application/x-www-form-urlencoded": {"schema": {"type": "object", "properties": {"name": {"type": "string"}}}}}}
+        assert path_to_input_schema("/pets", request_body=request_body, method="POST")["properties"] == {}
+
     def test_multiple_parameters(self):
         """Test multiple parameters of different types."""
         parameters = [
@@ -146,6 +217,55 @@ class TestPathToInputSchema:
         assert "userId" in schema["required"]
         assert "limit" not in schema["required"]
 
+    def test_path_placeholders_without_parameters(self):
+        """Test that undeclared word-character placeholders become required string properties."""
+        schema = path_to_input_schema("/orgs/{org_id}/files/{file-name}/{v2}")
+
+        assert list(schema["properties"]) == ["org_id", "v2"]
+        assert schema["required"] == ["org_id", "v2"]
+
+    def test_no_inputs_returns_fresh_empty_schema(self):
+        """Test that input-less operations get an empty schema that is never shared between calls."""
+        first = path_to_input_schema("/health")
+        second = path_to_input_schema("/health", parameters=[], method="POST")
+
+        assert first == second == {"type": "object", "properties": {}, "required": []}
+        first["properties"]["probe"] = {"type": "string"}
+        assert second["properties"] == {}
+
+    def test_returns_plain_json_schema_dict(self):
+        """Test that the schema is a plain dict that ToolCreate and the JSON column accept as-is."""
+        schema = path_to_input_schema("/pet/{petId}", parameters=[{"name": "petId", "in": "path", "schema": {"type": "integer"}}])
+
+        assert type(schema) is dict
+        assert orjson.loads(orjson.dumps(schema)) == {"type": "object", "properties": {"petId": {"type": "integer", "description": ""}}, "required": ["petId"]}
+
+    def test_reads_parameters_in_place(self):
+        """Test that raw parameter and body objects are read without being rewritten or annotated."""
+        parameters = [{"name": "petId", "in": "path", "schema": {"type": "integer"}}, {"name": "X-Trace", "in": "header"}, {"name": "verbose", "in": "query", "required": False}]
+        request_body = {"required": True, "content": {"application/json": {"schema": {"type": "array"}}}}
+        snapshot = copy.deepcopy((parameters, request_body))
+
+        path_to_input_schema("/pet/{petId}", parameters=parameters, request_body=request_body, method="POST")
+
+        assert (parameters, request_body) == snapshot
+
+    def test_required_deduplicated(self):
+        """Test that a field required by both a parameter and the body is listed once, in order."""
+        parameters = [{"name": "userId", "in": "path", "required": True}, {"name": "name", "in": "query", "required": True}]
+        request_body = {"content": {"application/json": {"schema": {"type": "object", "properties": {"name": {"type": "string"}, "age": {"type": "integer"}}, "required": ["name", "age"]}}}}
+        schema = path_to_input_schema("/user/{userId}", parameters=parameters, request_body=request_body, method="PUT")
+
+        assert schema["required"] == ["userId", "name", "age"]
+
+    def test_required_keeps_declaration_order(self):
+        """Test that required fields follow the spec's declaration order rather than being sorted."""
+        fields = [f"field{i:02d}" for i in reversed(range(25))]
+        request_body = {"content": {"application/json": {"schema": {"type": "object", "properties": {f: {"type": "string"} for f in fields}, "required": fields + fields[:5]}}}}
+        schema = path_to_input_schema("/zones/{zone}", request_body=request_body, method="POST")
+
+        assert schema["required"] == ["zone"] + fields
+
 
 class TestConvertOpenapiToTools:
     """Test conversion of OpenAPI spec to ToolCreate objects."""
@@ -171,6 +291,15 @@ class TestConvertOpenapiToTools:
         assert tools[0].url == "https://api.example.com/users"
         assert tools[0].integration_type == "REST"
 
+    def test_minimal_operation_is_json_serializable(self):
+        """Test that operations without parameters or auth still yield plain, serializable tool fields."""
+        spec = {"paths": {"/health": {"get": {"operationId": "health", "requestBody": {"description": "ignored"}}}}}
+        tools = convert_openapi_to_tools(spec, "https://api.example.com", {"auth_type": None})
+
+        assert tools[0].headers is None
+        assert tools[0].input_schema == {"type": "object", "properties": {}, "required": []}
+        assert orjson.loads(orjson.dumps(tools[0].input_schema)) == tools[0].input_schema
+
     def test_post_endpoint_with_body(self):
         """Test conversion of POST endpoint with request body."""
         spec = {
@@ -210,6 +339,31 @@ class TestConvertOpenapiToTools:
         assert len(tools) == 1
         assert tools[0].name == "myapi_getUsers"
 
+        spec = {"paths": {"/pet/{petId}": {"get": {"summary": "Get pet by ID"}}}}
+        tools = convert_openapi_to_tools(spec, "https://api.example.com", {}, namespace="myapi")
+        assert tools[0].name == "myapi_get_pet_petId"
+
+    def test_empty_operation_id_falls_back_to_generated_name(self):
+        """Test that a blank or null operationId is treated like a missing one."""
+        spec = {"paths": {"/pet/{petId}": {"get": {"operationId": ""}, "delete": {"operationId": None}}}}
+        tools = convert_openapi_to_tools(spec, "https://api.example.com", {}, namespace="myapi")
+
+        assert [t.name for t in tools] == ["myapi_get_pet_petId", "myapi_delete_pet_petId"]
+
+    def test_unsupported_methods_skipped(self):
+        """Test that HEAD/OPTIONS/TRACE operations and path-item metadata are not converted into tools."""
+        spec = {"paths": {"/pets": {"summary": "Pets", "parameters": [], "head": {}, "options": {}, "trace": {}, "get": {"operationId": "listPets"}}}}
+        tools = convert_openapi_to_tools(spec, "https://api.example.com", {})
+
+        assert [(t.name, t.request_type) for t in tools] == [("listPets", "GET")]
+
+    def test_vendor_extensions_skipped(self):
+        """Test that x-* entries of the paths object are not converted into tools."""
+        spec = {"paths": {"x-gateway": {"get": {"operationId": "notAnEndpoint"}}, "/users": {"get": {"operationId": "getUsers", "x-rate-limit": 10}}}}
+        tools = convert_openapi_to_tools(spec, "https://api.example.com", {})
+
+        assert [t.name for t in tools] == ["getUsers"]
+
     def test_no_operation_id(self):
         """Test generation when operationId is missing."""
         spec = {"paths": {"/pet/{petId}": {"get": {"summary": "Get pet by ID"}}}}
@@ -217,6 +371,7 @@ class TestConvertOpenapiToTools:
 
         assert len(tools) == 1
         assert tools[0].name == "get_pet_petId"
+        assert tools[0].tags == []
 
     def test_with_api_key_auth(self):
         """Test tool creation with API key authentication."""
@@ -228,6 +383,156 @@ class TestConvertOpenapiToTools:
         assert tools[0].headers is not None
         assert "X-API-KEY" in tools[0].headers
 
+    def test_untrusted_fields_are_validated(self):
+        """Test that tool fields taken from the spec go through ToolCreate validation."""
+        spec = {"paths": {"/data": {"get": {"operationId": "drop table; --"}}}}
+        with pytest.raises(ValueError, match="Tool name must start with a letter"):
+            convert_openapi_to_tools(spec, "https://api.example.com", {})
+
+        spec = {"paths": {"/data": {"get": {"summary": "<script>alert(1)</script>"}}}}
+        with pytest.raises(ValueError, match="HTML tags"):
+            convert_openapi_to_tools(spec, "https://api.example.com", {})
+
+    def test_local_refs_resolved(self):
+        """Test that $ref parameters, request bodies and body schemas are resolved."""
+        spec = {
+            "paths": {
+                "/pets/{petId}": {
+                    "put": {
+                        "operationId": "updatePet",
+                        "parameters": [{"$ref": "#/components/parameters/PetId"}],
+                        "requestBody": {"$ref": "#/components/requestBodies/PetBody"},
+                    }
+                }
+            },
+            "components": {
+                "parameters": {"PetId": {"name": "petId", "in": "path", "required": True, "schema": {"type": "integer"}}},
+                "requestBodies": {"PetBody": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Pet"}}}}},
+                "schemas": {"Pet": {"type": "object", "properties": {"name": {"type": "string"}}, "required": ["name"]}},
+            },
+        }
+        tools = convert_openapi_to_tools(spec, "https://api.example.com", {})
+
+        schema = tools[0].input_schema
+        assert schema["properties"]["petId"]["type"] == "integer"
+        assert schema["properties"]["name"] == {"type": "string"}
+        assert "petId" in schema["required"]
+        assert "name" in schema["required"]
+
+    def test_unresolvable_parameter_refs_skipped(self):
+        """Test that external, dangling and circular parameter refs are skipped instead of becoming a nameless property."""
+        spec = {
+            "paths": {
+                "/pets/{petId}": {
+                    "get": {
+                        "operationId": "getPet",
+                        "parameters": [
+                            {"$ref": "common.yaml#/components/parameters/Limit"},
+                            {"$ref": "#/components/parameters/Missing"},
+                            {"$ref": "#/components/parameters/Loop"},
+                            {"name": "verbose", "in": "query", "schema": {"type": "boolean"}},
+                        ],
+                    }
+                }
+            },
+            "components": {"parameters": {"Loop": {"$ref": "#/components/parameters/Loop"}}},
+        }
+        schema = convert_openapi_to_tools(spec, "https://api.example.com", {})[0].input_schema
+
+        assert list(schema["properties"]) == ["verbose", "petId"]
+        assert schema["required"] == ["petId"]
+
+    def test_nested_refs_emitted_as_defs(self):
+        """Test that property, items and recursive $refs inside body schemas point into the tool schema's own $defs."""
+        spec = {
+            "paths": {"/pet": {"post": {"operationId": "addPet", "requestBody": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Pet"}}}}}}},
+            "components": {
+                "schemas": {
+                    "Pet": {
+                        "type": "object",
+                        "required": ["name"],
+                        "properties": {
+                            "name": {"type": "string"},
+                            "category": {"$ref": "#/components/schemas/Category"},
+                            "tags": {"type": "array", "items": {"$ref": "#/components/schemas/Tag"}},
+                            "parent": {"$ref": "#/components/schemas/Pet"},
+                            "owner": {"$ref": "owners.yaml#/Owner", "description": "Owner"},
+                        },
+                    },
+                    "Category": {"type": "object", "properties": {"id": {"type": "integer"}, "name": {"type": "string"}}},
+                    "Tag": {"type": "object", "properties": {"id": {"type": "integer"}}},
+                }
+            },
+        }
+        schema = convert_openapi_to_tools(spec, "https://api.example.com", {})[0].input_schema
+
+        assert "#/components/" not in orjson.dumps(schema).decode()
+        assert schema["properties"]["category"] == {"$ref": "#/$defs/Category"}
+        assert schema["properties"]["tags"]["items"] == {"$ref": "#/$defs/Tag"}
+        assert schema["properties"]["parent"] == {"$ref": "#/$defs/Pet"}
+        assert schema["properties"]["owner"] == {"description": "Owner"}
+        assert sorted(schema["$defs"]) == ["Category", "Pet", "Tag"]
+        jsonschema.validate({"name": "Rex", "category": {"id": 1, "name": "Dogs"}, "tags": [{"id": 2}], "parent": {"name": "Max", "parent": {"name": "Bo"}}}, schema)
+        with pytest.raises(jsonschema.ValidationError):
+            jsonschema.validate({"name": "Rex", "tags": [{"id": "two"}]}, schema)
+        with pytest.raises(jsonschema.ValidationError):
+            jsonschema.validate({"name": "Rex", "parent": {"parent": {}}}, schema)
+
+        # The schema is a copy: editing it leaves the spec untouched
+        schema["properties"]["name"]["type"] = "integer"
+        schema["$defs"]["Tag"]["properties"]["id"]["type"] = "string"
+        assert spec["components"]["schemas"]["Pet"]["properties"]["name"] == {"type": "string"}
+        assert spec["components"]["schemas"]["Tag"]["properties"]["id"] == {"type": "integer"}
+
+    def test_shared_schemas_emitted_once(self):
+        """Test that a diamond-shaped reference graph stays linear in size instead of being expanded per path."""
+        schemas = {f"Level{i}": {"type": "object", "properties": {f"p{j}": {"$ref": f"#/components/schemas/Level{i + 1}"} for j in range(10)}} for i in range(20)}
+        schemas["Level20"] = {"type": "object", "properties": {"id": {"type": "integer"}}}
+        spec = {
+            "paths": {f"/items/{i}": {"post": {"operationId": f"create{i}", "requestBody": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Level0"}}}}}} for i in range(5)},
+            "components": {"schemas": schemas},
+        }
+        tools = convert_openapi_to_tools(spec, "https://api.example.com", {})
+
+        assert len(tools) == 5
+        for tool in tools:
+            schema = tool.input_schema
+            assert sorted(schema["$defs"]) == sorted(f"Level{i}" for i in range(1, 21))
+            assert len(orjson.dumps(schema)) < 2 * len(orjson.dumps(schemas))
+        jsonschema.validate({"p0": {"p3": {"p9": {}}}}, tools[0].input_schema)
+
+    def test_deeply_nested_refs_pass_tool_validation(self):
+        """Test that chains of object refs stay within the ToolCreate JSON depth limit."""
+        spec = {
+            "paths": {"/orders": {"post": {"operationId": "createOrder", "requestBody": {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/Order"}}}}}}},
+            "components": {
+                "schemas": {
+                    "Order": {"type": "object", "properties": {"lines": {"type": "array", "items": {"$ref": "#/components/schemas/Line"}}}},
+                    "Line": {"type": "object", "properties": {"product": {"$ref": "#/components/schemas/Product"}}},
+                    "Product": {"type": "object", "properties": {"category": {"$ref": "#/components/schemas/Category"}}},
+                    "Category": {"type": "object", "properties": {"vendor": {"$ref": "#/components/schemas/Vendor"}}},
+                    "Vendor": {"type": "object", "properties": {"address": {"$ref": "#/components/schemas/Address"}}},
+                    "Address": {"type": "object", "properties": {"country": {"type": "array", "items": {"$ref": "#/components/schemas/Country"}}}},
+                    "Country": {"type": "object", "properties": {"code": {"type": "string"}}},
+                }
+            },
+        }
+        # Goes through real ToolCreate validation, including validate_json_depth
+        schema = convert_openapi_to_tools(spec, "https://api.example.com", {})[0].input_schema
+
+        assert len(schema["$defs"]) == 6
+        jsonschema.validate({"lines": [{"product": {"category": {"vendor": {"address": {"country": [{"code": "DE"}]}}}}}]}, schema)
+        with pytest.raises(jsonschema.ValidationError):
+            jsonschema.validate({"lines": [{"product": {"category": {"vendor": {"address": {"country": [{"code": 49}]}}}}}]}, schema)
+
+    def test_rest_passthrough_fields_derived(self):
+        """Test that validation derives the REST passthrough fields from the tool URL."""
+        spec = {"paths": {"/pet/{petId}": {"get": {"operationId": "getPet"}}}}
+        tools = convert_openapi_to_tools(spec, "https://api.example.com/v1", {})
+
+        assert tools[0].base_url == "https://api.example.com"
+        assert tools[0].path_template == "/v1/pet/{petId}"
+
 
 @pytest.mark.asyncio
 async def test_parse_openapi_spec_from_content():
@@ -251,6 +556,61 @@ paths:
     assert "/test" in spec["paths"]
 
 
+@pytest.mark.asyncio
+async def test_parse_openapi_spec_from_json_content():
+    """Test parsing a JSON OpenAPI spec without going through the YAML loader."""
+    json_content = '{"openapi": "3.0.0", "info": {"title": "JSON API", "version": "1.0.0"}, "paths": {"/test": {"get": {"operationId": "testGet"}}}}'
+    with patch("mcpgateway.utils.openapi_parser.yaml.load") as mock_load:
+        spec = await parse_openapi_spec(content=json_content)
+
+    mock_load.assert_not_called()
+    assert spec["info"]["title"] == "JSON API"
+    assert "/test" in spec["paths"]
+
+
+@pytest.mark.asyncio
+async def test_parse_openapi_spec_yaml_skips_json_attempt():
+    """Test that YAML content is not first run through the JSON parser."""
+    with patch("mcpgateway.utils.openapi_parser.orjson.loads") as mock_loads:
+        spec = await parse_openapi_spec(content=SIMPLE_SPEC_YAML)
+
+    mock_loads.assert_not_called()
+    assert spec["info"]["title"] == "Cached API"
+
+
+@pytest.mark.asyncio
+async def test_parse_openapi_spec_json_lookalike_falls_back_to_yaml():
+    """Test that brace-led content orjson rejects is still parsed (or reported) by the YAML loader."""
+    spec = await parse_openapi_spec(content="{openapi: 3.0.0, info: {title: Flow API, version: 1.0.0}, paths: {}}")
+    assert spec["info"]["title"] == "Flow API"
+
+    with pytest.raises(ValueError, match="Failed to parse YAML at line 1"):
+        await parse_openapi_spec(content='{"openapi": "3.0.0", "paths": {]}')
+
+
+@pytest.mark.asyncio
+async def test_parse_openapi_spec_from_bytes_content():
+    """Test that raw UTF-8 content is accepted (with or without a BOM) and undecodable bytes are reported."""
+    spec = await parse_openapi_spec(content=b"\xef\xbb\xbf" + SIMPLE_SPEC_YAML.encode())
+    assert spec["info"]["title"] == "Cached API"
+
+    spec = await parse_openapi_spec(content=b'{"openapi": "3.0.0", "info": {"title": "Caf\xc3\xa9 API"}, "paths": {}}')
+    assert spec["info"]["title"] == "Café API"
+
+    with pytest.raises(ValueError, match="Failed to parse YAML"):
+        await parse_openapi_spec(content=b"openapi: \xff\xfe3.0.0")
+
+
+@pytest.mark.asyncio
+async def test_parse_openapi_spec_large_content_parsed_in_thread():
+    """Test that specs above the size threshold are parsed off the event loop."""
+    with patch.object(openapi_parser, "_THREAD_PARSE_THRESHOLD", 0), patch("mcpgateway.utils.openapi_parser.asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+        spec = await parse_openapi_spec(content=SIMPLE_SPEC_YAML)
+
+    mock_to_thread.assert_called_once()
+    assert spec["info"]["title"] == "Cached API"
+
+
 @pytest.mark.asyncio
 async def test_parse_openapi_spec_validation():
     """Test validation errors in parse_openapi_spec."""
@@ -266,6 +626,139 @@ async def test_parse_openapi_spec_validation():
     with pytest.raises(ValueError, match="Failed to parse YAML"):
         await parse_openapi_spec(content="invalid: yaml: content:")
 
+    # The loader reports where it failed, including deep inside the document
+    with pytest.raises(ValueError, match="line 1, column 14"):
+        await parse_openapi_spec(content="invalid: yaml: content:")
+    with pytest.raises(ValueError, match="line 3, column 11"):
+        await parse_openapi_spec(content="openapi: 3.0.0\ninfo:\n  title: a: b\n")
+
+
+@pytest.mark.asyncio
+async def test_parse_openapi_spec_caches_content():
+    """Test that identical content is parsed only once."""
+    first = await parse_openapi_spec(content=SIMPLE_SPEC_YAML)
+    with patch("mcpgateway.utils.openapi_parser.yaml.load") as mock_load:
+        second = await parse_openapi_spec(content=SIMPLE_SPEC_YAML)
+
+    mock_load.assert_not_called()
+    assert second is first
+
+
+@pytest.mark.asyncio
+async def test_parse_openapi_spec_does_not_cache_large_specs():
+    """Test that specs above the cache size limit are parsed every time instead of being pinned in memory."""
+    with patch.object(openapi_parser, "_SPEC_CACHE_MAX_SOURCE_BYTES", 16):
+        await parse_openapi_spec(content=SIMPLE_SPEC_YAML)
+        with patch("mcpgateway.utils.openapi_parser.yaml.load", wraps=openapi_parser.yaml.load) as mock_load:
+            await parse_openapi_spec(content=SIMPLE_SPEC_YAML)
+
+    mock_load.assert_called_once()
+    assert not openapi_parser._spec_cache
+
+
+@pytest.mark.asyncio
+async def test_cached_spec_not_aliased_by_tool_schemas():
+    """Test that generated input schemas are copies, so editing them cannot corrupt the cached spec."""
+    spec_yaml = """
+openapi: 3.0.0
+info: {title: Pets, version: 1.0.0}
+paths:
+  /pets:
+    post:
+      operationId: addPet
+      requestBody:
+        content:
+          application/json:
+            schema:
+              type: object
+              properties:
+                name: {type: string, enum: [a, b]}
+  /pets/{status}:
+    get:
+      operationId: getPets
+      parameters:
+        - {name: status, in: path, schema: {type: string, enum: [sold], default: sold}}
+"""
+    spec = await parse_openapi_spec(content=spec_yaml)
+    tools = convert_openapi_to_tools(spec, "https://api.example.com", {})
+    tools[0].input_schema["properties"]["name"]["enum"].append("c")
+    tools[1].input_schema["properties"]["status"]["enum"].append("available")
+
+    cached = await parse_openapi_spec(content=spec_yaml)
+    assert cached["paths"]["/pets"]["post"]["requestBody"]["content"]["application/json"]["schema"]["properties"]["name"]["enum"] == ["a", "b"]
+    assert cached["paths"]["/pets/{status}"]["get"]["parameters"][0]["schema"]["enum"] == ["sold"]
+
+
+@pytest.mark.asyncio
+async def test_parse_openapi_spec_revalidates_url_with_etag():
+    """Test that a 304 response reuses the cached spec."""
+    seen_headers = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text=SIMPLE_SPEC_YAML, headers={"ETag": '"v1"'})
+
+    real_client = httpx.AsyncClient
+    with patch("mcpgateway.utils.openapi_parser.httpx.AsyncClient", side_effect=lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)):
+        first = await parse_openapi_spec(url="https://api.example.com/openapi.yaml")
+        second = await parse_openapi_spec(url="https://api.example.com/openapi.yaml")
+
+    assert seen_headers == [None, '"v1"']
+    assert second is first
+    assert second["info"]["title"] == "Cached API"
+
+
+@pytest.mark.asyncio
+async def test_parse_openapi_spec_does_not_cache_unvalidatable_urls():
+    """Test that URL fetches without ETag or Last-Modified are not cached, since they could never be revalidated."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=SIMPLE_SPEC_YAML)
+
+    real_client = httpx.AsyncClient
+    with patch("mcpgateway.utils.openapi_parser.httpx.AsyncClient", side_effect=lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs)):
+        spec = await parse_openapi_spec(url="https://api.example.com/openapi.yaml")
+
+    assert spec["info"]["title"] == "Cached API"
+    assert not openapi_parser._spec_cache
+
+
+@pytest.mark.asyncio
+async def test_parse_openapi_spec_fetches_with_aiohttp_when_enabled():
+    """Test the aiohttp fetch path, including 304 revalidation and error mapping."""
+    seen_headers = []
+
+    async def spec_handler(request: web.Request) -> web.Response:
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text=SIMPLE_SPEC_YAML, headers={"ETag": '"v1"'})
+
+    app = web.Application()
+    app.router.add_get("/openapi.yaml", spec_handler)
+    async with TestServer(app) as server:
+        with patch.object(openapi_parser.settings, "use_aiohttp_for_spec_fetch", True):
+            first = await parse_openapi_spec(url=str(server.make_url("/openapi.yaml")))
+            second = await parse_openapi_spec(url=str(server.make_url("/openapi.yaml")))
+            with pytest.raises(ValueError, match="HTTP error fetching OpenAPI spec .*: 404"):
+                await parse_openapi_spec(url=str(server.make_url("/missing.yaml")))
+
+    assert seen_headers == [None, '"v1"']
+    assert second is first
+    assert openapi_parser._spec_http_client is None
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_session_matches_httpx_client_behaviour():
+    """Test that the aiohttp session honours proxy/CA environment variables and uses per-operation timeouts like httpx."""
+    session = await openapi_parser._get_spec_aiohttp_session()
+
+    assert session.trust_env is True
+    assert session.timeout.total is None
+    assert session.timeout.sock_connect == session.timeout.sock_read == openapi_parser._SPEC_FETCH_TIMEOUT
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])